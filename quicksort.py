@@ -1,18 +1,114 @@
 import random
 
-def randomized_quicksort(arr):
-   
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-    if len(arr) <= 1:
-        return arr
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _qs_numba(a, lo, hi):
+        # Same in-place randomized 3-way partition as _qs below, but compiled
+        # to native code by Numba: comparisons and swaps run on unboxed int64
+        # values instead of PyObject ints.
+        while lo < hi:
+            pivot_index = np.random.randint(lo, hi + 1)
+            a[lo], a[pivot_index] = a[pivot_index], a[lo]
+            pivot = a[lo]
+
+            lt, i, gt = lo, lo + 1, hi
+            while i <= gt:
+                if a[i] < pivot:
+                    a[lt], a[i] = a[i], a[lt]
+                    lt += 1
+                    i += 1
+                elif a[i] > pivot:
+                    a[i], a[gt] = a[gt], a[i]
+                    gt -= 1
+                else:
+                    i += 1
+
+            if (lt - 1) - lo < hi - (gt + 1):
+                _qs_numba(a, lo, lt - 1)
+                lo = gt + 1
+            else:
+                _qs_numba(a, gt + 1, hi)
+                hi = lt - 1
+
+def _qs(a, lo, hi):
+    # In-place randomized quicksort with 3-way (Dutch National Flag)
+    # partitioning. The larger side is handled by the while loop instead of
+    # a recursive call, so recursion depth stays O(log n).
+    while lo < hi:
+        # Pick a random pivot and move it to the front
+        pivot_index = random.randint(lo, hi)
+        a[lo], a[pivot_index] = a[pivot_index], a[lo]
+        pivot = a[lo]
 
+        # 3-way partition: a[lo..lt-1] < pivot, a[lt..gt] == pivot, a[gt+1..hi] > pivot
+        lt, i, gt = lo, lo + 1, hi
+        while i <= gt:
+            if a[i] < pivot:
+                a[lt], a[i] = a[i], a[lt]
+                lt += 1
+                i += 1
+            elif a[i] > pivot:
+                a[i], a[gt] = a[gt], a[i]
+                gt -= 1
+            else:
+                i += 1
+
+        # Recurse on the smaller partition, loop on the larger one
+        if (lt - 1) - lo < hi - (gt + 1):
+            _qs(a, lo, lt - 1)
+            lo = gt + 1
+        else:
+            _qs(a, gt + 1, hi)
+            hi = lt - 1
+
+
+def randomized_quicksort(arr):
+    # Fastest path: JIT-compiled kernel for all-int input. The whole
+    # recursion runs as native code over a contiguous int64 buffer.
+    # type(x) is int excludes bool (an int subclass that would come back as
+    # 0/1), and the range check keeps arbitrary-precision ints that don't
+    # fit in C int64 on the exact pure-Python path.
+    if njit is not None and arr and all(
+            type(x) is int and -2**63 <= x < 2**63 for x in arr):
+        a = np.asarray(arr, dtype=np.int64)
+        _qs_numba(a, 0, len(a) - 1)
+        arr[:] = a.tolist()
+        return arr
 
-    pivot = random.choice(arr)
-    less = [x for x in arr if x < pivot]
-    equal = [x for x in arr if x == pivot]
-    greater = [x for x in arr if x > pivot]
+    # Fast path: delegate the inner compare/swap loop to NumPy's
+    # C-implemented quicksort over a contiguous buffer. Shuffling first
+    # randomizes pivot selection statistically, matching the
+    # randomized-quicksort guarantee. Only taken when the conversion
+    # preserves values exactly: all floats, or all ints that fit in int64.
+    # Mixed int/float input would upcast the ints to float64 (changing the
+    # elements, and losing precision above 2^53), so it falls through to
+    # the pure-Python version, as do heterogeneous keys and environments
+    # without NumPy.
+    if np is not None and arr:
+        if all(type(x) is float for x in arr):
+            a = np.asarray(arr)
+        elif all(type(x) is int and -2**63 <= x < 2**63 for x in arr):
+            a = np.asarray(arr, dtype=np.int64)
+        else:
+            a = None
+        if a is not None:
+            np.random.shuffle(a)
+            a.sort(kind='quicksort')
+            arr[:] = a.tolist()
+            return arr
 
-    return randomized_quicksort(less) + equal + randomized_quicksort(greater)
+    _qs(arr, 0, len(arr) - 1)
+    return arr
 
 
 
@@ -21,15 +117,15 @@ def randomized_quicksort(arr):
 print(randomized_quicksort([]))
 
     # Single element
-print(randomized_quicksort([42]))  
+print(randomized_quicksort([42]))
 
     # Already sorted array
-print(randomized_quicksort([1, 2, 3, 4, 5]))  
+print(randomized_quicksort([1, 2, 3, 4, 5]))
 
     # Reverse sorted array
-print(randomized_quicksort([5, 4, 3, 2, 1]))  
+print(randomized_quicksort([5, 4, 3, 2, 1]))
     # Array with duplicates
-print(randomized_quicksort([3, 6, 3, 2, 7, 2, 2, 5])) 
+print(randomized_quicksort([3, 6, 3, 2, 7, 2, 2, 5]))
 
     # Random array
-print(randomized_quicksort([10, -1, 0, 5, 2, 10, 3]))  
\ No newline at end of file
+print(randomized_quicksort([10, -1, 0, 5, 2, 10, 3]))
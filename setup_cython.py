@@ -0,0 +1,13 @@
+"""Build script for the optional Cython-accelerated hash table.
+
+Usage:
+    python setup_cython.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="hashing_cy",
+    ext_modules=cythonize("hashing_cy.pyx", language_level=3),
+)